@@ -5,8 +5,10 @@ import sentry_sdk
 from blacksheep import Application, Request, Response
 from blacksheep.server.authentication.jwt import JWTBearerAuthentication
 from blacksheep.server.authorization import Policy
+from blacksheep.settings.json import json_settings
 from guardpost.common import AuthenticatedRequirement
 from loguru import logger
+from pydantic_core import from_json, to_json
 from redis.asyncio import Redis, RedisError
 from rodi import Container
 from sentry_sdk.integrations.asgi import SentryAsgiMiddleware
@@ -20,8 +22,12 @@ from battleship.server.metrics import (
     MetricsScraperAuthenticationHandler,
 )
 from battleship.server.repositories import ClientRepository
+from battleship.server.repositories.utils import scan_keys
 from battleship.server.routes import router
 
+# Prefixes of the keys written before the repositories switched to hash tags.
+LEGACY_KEY_PATTERNS = ("clients:*", "sessions:*", "subscriptions:*")
+
 
 async def cleanup_clients(app: Application) -> None:
     client_repository = app.services.resolve(ClientRepository)
@@ -34,6 +40,21 @@ async def cleanup_clients(app: Application) -> None:
         raise
 
 
+async def cleanup_legacy_keys(app: Application) -> None:
+    client = app.services.resolve(Redis)
+
+    try:
+        keys = [key for pattern in LEGACY_KEY_PATTERNS for key in await scan_keys(client, pattern)]
+
+        if keys:
+            await client.unlink(*keys)
+
+        logger.debug("Cleaned up {count} legacy keys.", count=len(keys))
+    except Exception as exc:
+        logger.exception(exc)
+        raise
+
+
 async def teardown_redis(app: Application) -> None:
     client = app.services.resolve(Redis)
 
@@ -86,11 +107,20 @@ def configure_logging(level: str) -> None:
     logger.enable(PACKAGE_NAME)
 
 
+def json_dumps(obj: Any) -> str:
+    return to_json(obj).decode()
+
+
+def configure_json() -> None:
+    json_settings.use(loads=from_json, dumps=json_dumps)  # type: ignore[no-untyped-call]
+
+
 def create_app(container: Container | None = None) -> Any:
     services = container or build_container()
     connect_event_handlers(services)
     config = services.resolve(Config)
     configure_logging("TRACE" if config.TRACE else "DEBUG")
+    configure_json()
 
     app = Application(router=router, services=services)
 
@@ -110,6 +140,7 @@ def create_app(container: Container | None = None) -> Any:
         Policy("authenticated", AuthenticatedRequirement()),
     )
 
+    app.on_start += cleanup_legacy_keys
     app.on_stop += cleanup_clients
     app.on_stop += teardown_redis
 
@@ -1,4 +1,5 @@
 import abc
+import asyncio
 from collections.abc import Awaitable, Callable
 
 from pymitter import EventEmitter  # type: ignore[import-untyped]
@@ -9,7 +10,21 @@ from battleship.shared.events import AnyMessage
 class MessageBus(abc.ABC):
     @abc.abstractmethod
     async def emit(self, event: str, message: AnyMessage) -> None:
-        pass
+        """
+        Schedule the message for delivery and return without waiting for listeners.
+        """
+
+    @abc.abstractmethod
+    async def emit_text(self, event: str, text: str) -> None:
+        """
+        Like `emit`, but for a message already serialized to a websocket frame.
+        """
+
+    @abc.abstractmethod
+    async def deliver(self, event: str, message: AnyMessage) -> None:
+        """
+        Deliver the message and wait until all listeners have handled it.
+        """
 
     @abc.abstractmethod
     def subscribe(self, event: str, func: Callable[..., Awaitable[None]]) -> None:
@@ -23,12 +38,26 @@ class MessageBus(abc.ABC):
 class InMemoryMessageBus(MessageBus):
     def __init__(self, emitter: EventEmitter | None = None):
         self._ee = emitter or EventEmitter()
+        # The event loop keeps only weak references to tasks,
+        # so pending deliveries must be referenced until they finish.
+        self._deliveries: set[asyncio.Task[None]] = set()
 
     async def emit(self, event: str, message: AnyMessage) -> None:
-        self._ee.emit_future(event, message)
+        self._schedule(event, message)
+
+    async def emit_text(self, event: str, text: str) -> None:
+        self._schedule(event, text)
+
+    async def deliver(self, event: str, message: AnyMessage) -> None:
+        await self._ee.emit_async(event, message)
 
     def subscribe(self, event: str, func: Callable[..., Awaitable[None]]) -> None:
         self._ee.on(event, func)
 
     def unsubscribe(self, event: str, func: Callable[..., Awaitable[None]]) -> None:
         self._ee.off(event, func)
+
+    def _schedule(self, event: str, payload: AnyMessage | str) -> None:
+        delivery = asyncio.create_task(self._ee.emit_async(event, payload))
+        self._deliveries.add(delivery)
+        delivery.add_done_callback(self._deliveries.discard)
@@ -8,6 +8,7 @@ from battleship.server.game import GameManager
 from battleship.server.handlers import (
     ClientDisconnectedHandler,
     HandleServerGameEvent,
+    NotificationHandler,
     PlayersIngameSubscriptionHandler,
     PlayersOnlineSubscriptionHandler,
     SessionUpdateHandler,
@@ -29,6 +30,7 @@ def connect_event_handlers(services: Container) -> None:
     message_bus.subscribe("entities.session", services.resolve(SessionUpdateHandler))
     message_bus.subscribe("entities.session", services.resolve(PlayersIngameSubscriptionHandler))
     message_bus.subscribe("entities.client", services.resolve(PlayersOnlineSubscriptionHandler))
+    message_bus.subscribe("notifications", services.resolve(NotificationHandler))
     message_bus.subscribe("websocket", services.resolve(ClientDisconnectedHandler))
     message_bus.subscribe("games", services.resolve(HandleServerGameEvent))
 
@@ -45,6 +47,7 @@ def build_container() -> Container:
     container.add_singleton(SessionUpdateHandler)
     container.add_singleton(PlayersIngameSubscriptionHandler)
     container.add_singleton(PlayersOnlineSubscriptionHandler)
+    container.add_singleton(NotificationHandler)
     container.add_singleton(ClientDisconnectedHandler)
     container.add_singleton(HandleServerGameEvent)
     container.add_singleton(AuthManager, Auth0AuthManager)
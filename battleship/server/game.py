@@ -1,6 +1,6 @@
 import asyncio
 from time import time
-from typing import Collection, Literal
+from typing import Callable, Collection, Literal
 
 from loguru import logger
 
@@ -22,8 +22,8 @@ from battleship.shared.events import (
 from battleship.shared.models import (
     Client,
     GameSummary,
-    Roster,
     Session,
+    get_roster_model,
     salvo_to_model,
 )
 
@@ -48,16 +48,34 @@ class Game:
         self.summary = GameSummary()
         self.start: float = 0
         self.clients: dict[str, Client] = {host.nickname: host, guest.nickname: guest}
+        self.out_topics: dict[str, str] = {
+            nickname: f"clients.out.{client.id}" for nickname, client in self.clients.items()
+        }
         self.players: dict[str, domain.Player] = {
             self.game.player_a.name: self.game.player_a,
             self.game.player_b.name: self.game.player_b,
         }
+        self._awaiting_move_messages: dict[str, Message[GameEvent]] = {
+            actor.name: self._make_awaiting_move_message(actor, subject)
+            for actor, subject in (
+                (self.game.player_a, self.game.player_b),
+                (self.game.player_b, self.game.player_a),
+            )
+        }
+
+        self._client_event_handlers: dict[str, Callable[[str, GameEvent], None]] = {
+            ClientGameEvent.SPAWN_SHIP: self.on_spawn_ship,
+            ClientGameEvent.FIRE: self.on_fire,
+            ClientGameEvent.CANCEL_GAME: self.on_cancel_game,
+        }
 
         self.game.on(domain.ShipSpawned, self.on_ship_spawned)
         self.game.on(domain.NextMove, self.on_next_move)
         self.game.on(domain.GameEnded, self.on_game_ended)
 
-        self._event_queue: asyncio.Queue[Message[GameEvent]] = asyncio.Queue()
+        self._event_queue: asyncio.Queue[tuple[Message[GameEvent], Collection[str]]] = (
+            asyncio.Queue()
+        )
         self._background_tasks = [
             self._run_broadcaster(),
         ]
@@ -73,10 +91,11 @@ class Game:
         @logger.catch
         async def broadcaster() -> None:
             while True:
-                event = await self._event_queue.get()
+                event, topics = await self._event_queue.get()
+                text = event.to_json()
 
-                for client in self.clients.values():
-                    await self.message_bus.emit(f"clients.out.{client.id}", event)
+                for topic in topics:
+                    await self.message_bus.emit_text(topic, text)
 
                 self._event_queue.task_done()
 
@@ -86,20 +105,27 @@ class Game:
         self._stop_event.set()
 
     def broadcast(self, msg: Message[GameEvent]) -> None:
-        self._event_queue.put_nowait(msg)
+        self._event_queue.put_nowait((msg, self.out_topics.values()))
 
-    def on_next_move(self, event: domain.NextMove) -> None:
-        payload = dict(actor=event.actor.name, subject=event.subject.name)
+    def send(self, player: str, msg: Message[GameEvent]) -> None:
+        self._event_queue.put_nowait((msg, (self.out_topics[player],)))
 
-        self.broadcast(
-            Message(
-                event=GameEvent(
-                    type=ServerGameEvent.AWAITING_MOVE,
-                    payload=payload,
-                )
+    @staticmethod
+    def _make_awaiting_move_message(
+        actor: domain.Player, subject: domain.Player
+    ) -> Message[GameEvent]:
+        payload = dict(actor=actor.name, subject=subject.name)
+
+        return Message(
+            event=GameEvent(
+                type=ServerGameEvent.AWAITING_MOVE,
+                payload=payload,
             )
         )
 
+    def on_next_move(self, event: domain.NextMove) -> None:
+        self.broadcast(self._awaiting_move_messages[event.actor.name])
+
     def send_salvo(self, salvo: domain.Salvo) -> None:
         model = salvo_to_model(salvo)
         msg = Message[GameEvent](
@@ -127,8 +153,7 @@ class Game:
         msg = Message[GameEvent](
             event=GameEvent(type=ServerGameEvent.SHIP_SPAWNED, payload=payload)
         )
-        client = self.clients[event.player.name]
-        asyncio.create_task(self.message_bus.emit(f"clients.out.{client.id}", msg))
+        self.send(event.player.name, msg)
 
         if event.fleet_ready:
             self.broadcast(
@@ -153,47 +178,44 @@ class Game:
             self.broadcast(msg)
         else:
             client = self.guest if self.host.nickname == by_player else self.host
-            client = self.clients[client.nickname]
-            asyncio.create_task(self.message_bus.emit(f"clients.out.{client.id}", msg))
+            self.send(client.nickname, msg)
 
-    def announce_game_start(self) -> None:
+    async def announce_game_start(self) -> None:
         game_options = dict(
-            roster=Roster.from_domain(self.roster).to_dict(),
+            roster=get_roster_model(self.roster.name).to_dict(),
             firing_order=self.game.firing_order,
             salvo_mode=self.game.salvo_mode,
             no_adjacent_ships=self.game.no_adjacent_ships,
         )
 
-        asyncio.create_task(
-            self.message_bus.emit(
-                f"clients.out.{self.host.id}",
+        await asyncio.gather(
+            self.message_bus.emit_text(
+                self.out_topics[self.host.nickname],
                 Message(
                     event=GameEvent(
                         type=ServerGameEvent.START_GAME,
                         payload=dict(enemy=self.guest.nickname, **game_options),
                     )
-                ),
-            )
-        )
-        asyncio.create_task(
-            self.message_bus.emit(
-                f"clients.out.{self.guest.id}",
+                ).to_json(),
+            ),
+            self.message_bus.emit_text(
+                self.out_topics[self.guest.nickname],
                 Message(
                     event=GameEvent(
                         type=ServerGameEvent.START_GAME,
                         payload=dict(enemy=self.host.nickname, **game_options),
                     )
-                ),
-            )
+                ).to_json(),
+            ),
         )
 
     async def play(self) -> GameSummary:
         metrics.games_started_total.inc({})
         self.connect_event_handlers()
-        self.announce_game_start()
-        self.start = time()
 
         try:
+            await self.announce_game_start()
+            self.start = time()
             await self._stop_event.wait()
             metrics.games_finished_total.inc({})
             return self.summary
@@ -225,24 +247,30 @@ class Game:
         player = self.players[nickname]
         self.game.add_ship(player, position, ship_id)
 
+    def on_spawn_ship(self, client_nickname: str, event: GameEvent) -> None:
+        ship_id: str = event.payload["ship_id"]
+        position: Collection[str] = event.payload["position"]
+        self.add_ship(client_nickname, position, ship_id)
+
+    def on_fire(self, client_nickname: str, event: GameEvent) -> None:
+        position: Collection[str] = event.payload["position"]
+        self.fire(position)
+
+    def on_cancel_game(self, client_nickname: str, event: GameEvent) -> None:
+        self.send_game_cancelled(reason="quit", by_player=client_nickname)
+        self.stop()
+
     def handle_client_event(self, client_nickname: str, message: Message[GameEvent]) -> None:
         logger.debug("Received message {message}", message=message)
         event = message.unwrap()
+        handler = self._client_event_handlers.get(event.type)
+
+        if handler is None:
+            logger.warning("Unknown event {event}", event=event)
+            return
 
         try:
-            match event:
-                case GameEvent(type=ClientGameEvent.SPAWN_SHIP):
-                    ship_id: str = event.payload["ship_id"]
-                    position: Collection[str] = event.payload["position"]
-                    self.add_ship(client_nickname, position, ship_id)
-                case GameEvent(type=ClientGameEvent.FIRE):
-                    position: Collection[str] = event.payload["position"]  # type: ignore[no-redef]
-                    self.fire(position)
-                case GameEvent(type=ClientGameEvent.CANCEL_GAME):
-                    self.send_game_cancelled(reason="quit", by_player=client_nickname)
-                    self.stop()
-                case _:
-                    logger.warning("Unknown event {event}", event=event)
+            handler(client_nickname, event)
         except Exception:  # noqa
             logger.exception(
                 "An exception occured while handling a game event. Session ID {session_id}",
@@ -313,13 +341,9 @@ class GameManager:
 
     async def start_new_game(self, session_id: str) -> None:
         session = await self._sessions.get(session_id)
-        players = await asyncio.gather(
-            self._clients.get(session.host_id),
-            self._clients.get(session.guest_id),
-        )
-        host, guest = players
+        host, guest = await self._clients.get_many([session.host_id, session.guest_id])
 
-        logger.debug(f"Start new game {host.nickname} vs. {guest.nickname}.")
+        logger.debug("Start new game {host} vs. {guest}.", host=host.nickname, guest=guest.nickname)
         game = Game(host, guest, session, self._message_bus)
         await self._sessions.update(session.id, guest_id=guest.id, started=True)
         task = asyncio.create_task(self.run_game(game))
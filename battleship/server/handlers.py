@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any
 
 from loguru import logger
@@ -107,9 +108,8 @@ class PlayersIngameSubscriptionHandler:
         if event.action not in (Action.START, Action.REMOVE):
             return
 
-        sessions = await self._sessions.list()
-        started_sessions = [s for s in sessions if s.started]
-        players_ingame = len(started_sessions) * 2
+        started_sessions = await self._sessions.count_started()
+        players_ingame = started_sessions * 2
         payload = dict(type="ingame_changed", count=players_ingame)
 
         await self._message_bus.emit(
@@ -123,6 +123,28 @@ class PlayersIngameSubscriptionHandler:
         )
 
 
+class NotificationHandler:
+    def __init__(
+        self,
+        subscription_repository: SubscriptionRepository,
+        message_bus: MessageBus,
+    ):
+        self._subscriptions = subscription_repository
+        self._message_bus = message_bus
+
+    async def __call__(self, message: Message[NotificationEvent]) -> None:
+        event = message.unwrap()
+        subscribers = await self._subscriptions.get_subscribers(event.subscription)
+        text = message.to_json()
+
+        await asyncio.gather(
+            *(
+                self._message_bus.emit_text(f"clients.out.{subscriber}", text)
+                for subscriber in subscribers
+            )
+        )
+
+
 class ClientDisconnectedHandler:
     def __init__(
         self,
@@ -1,10 +1,12 @@
-from typing import Any
+from functools import lru_cache
+from typing import Any, Sequence
 
 from aioprometheus.asgi.middleware import EXCLUDE_PATHS
 from aioprometheus.asgi.middleware import MetricsMiddleware as _MetricsMiddleware
 from aioprometheus.asgi.middleware import Receive, Scope, Send
 from aioprometheus.collectors import REGISTRY, Counter, Gauge
-from aioprometheus.renderer import render
+from aioprometheus.formats.base import IFormatter
+from aioprometheus.negotiator import negotiate
 from blacksheep import Request, Router
 from guardpost import AuthenticationHandler, Identity
 
@@ -67,7 +69,7 @@ class MetricsMiddleware(_MetricsMiddleware):
     def __init__(self, *args: Any, router: Router, **kwargs: Any):
         super().__init__(*args, **kwargs)
         self.router = router
-        self.exclude_paths = EXCLUDE_PATHS + ("/healthz",)
+        self.exclude_paths = frozenset(EXCLUDE_PATHS) | {"/healthz"}  # type: ignore[assignment]
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] == "websocket":
@@ -90,8 +92,16 @@ class MetricsMiddleware(_MetricsMiddleware):
         return full_path
 
 
-def render_metrics(accept_headers: list[bytes]) -> tuple[str, dict[bytes, bytes]]:
-    accept_headers_decoded = [value.decode() for value in accept_headers]
-    content, headers = render(REGISTRY, accept_headers_decoded)
-    headers = {k.encode(): v.encode() for k, v in headers.items()}
+@lru_cache(maxsize=16)
+def negotiate_format(
+    accept_headers: tuple[bytes, ...]
+) -> tuple[type[IFormatter], dict[bytes, bytes]]:
+    formatter = negotiate([value.decode() for value in accept_headers])
+    headers = formatter().get_headers()  # type: ignore[no-untyped-call]
+    return formatter, {k.encode(): v.encode() for k, v in headers.items()}
+
+
+def render_metrics(accept_headers: Sequence[bytes]) -> tuple[str, dict[bytes, bytes]]:
+    formatter, headers = negotiate_format(tuple(accept_headers))
+    content = formatter().marshall(REGISTRY)
     return content.decode(), headers
@@ -1,12 +1,37 @@
 import abc
 import asyncio
+from typing import Sequence
 
 import redis.asyncio as redis
 
 from battleship.server.bus import MessageBus
 from battleship.server.repositories.observable import Observable
+from battleship.server.repositories.utils import TTLCache, scan_keys
 from battleship.shared.models import Action, Client
 
+# The scripts below keep the client count in step with the client keys.
+# KEYS[1] is the client key, KEYS[2] is the count key.
+ADD_CLIENT = """
+local existing = redis.call("GET", KEYS[1])
+
+if existing then
+    return existing
+end
+
+redis.call("SET", KEYS[1], ARGV[1])
+redis.call("INCR", KEYS[2])
+return false
+"""
+DELETE_CLIENT = """
+local deleted = redis.call("DEL", KEYS[1])
+
+if deleted == 1 then
+    redis.call("DECR", KEYS[2])
+end
+
+return deleted
+"""
+
 
 class ClientNotFound(Exception):
     pass
@@ -26,13 +51,30 @@ class ClientRepository(Observable, abc.ABC):
         super().__init__(message_bus)
 
     @abc.abstractmethod
+    async def try_add(
+        self, client_id: str, nickname: str, guest: bool, version: str
+    ) -> tuple[Client, bool]:
+        """
+        Add a new client unless it already exists. Return the stored client
+        and whether it has been created.
+        """
+
     async def add(self, client_id: str, nickname: str, guest: bool, version: str) -> Client:
-        pass
+        client, created = await self.try_add(client_id, nickname, guest, version)
+
+        if not created:
+            raise ClientAlreadyExists(f"Client {client_id=} already exists.")
+
+        return client
 
     @abc.abstractmethod
     async def get(self, client_id: str) -> Client:
         pass
 
+    @abc.abstractmethod
+    async def get_many(self, client_ids: Sequence[str]) -> list[Client]:
+        pass
+
     @abc.abstractmethod
     async def list(self) -> list[Client]:
         pass
@@ -62,11 +104,16 @@ class InMemoryClientRepository(ClientRepository):
         super().__init__(message_bus)
         self._clients: dict[str, Client] = {}
 
-    async def add(self, user_id: str, nickname: str, guest: bool, version: str) -> Client:
-        client = Client(id=user_id, nickname=nickname, guest=guest, version=version)
+    async def try_add(
+        self, client_id: str, nickname: str, guest: bool, version: str
+    ) -> tuple[Client, bool]:
+        if existing := self._clients.get(client_id):
+            return existing, False
+
+        client = Client(id=client_id, nickname=nickname, guest=guest, version=version)
         self._clients[client.id] = client
         await self.notify(client.id, Action.ADD)
-        return client
+        return client, True
 
     async def get(self, client_id: str) -> Client:
         try:
@@ -74,6 +121,9 @@ class InMemoryClientRepository(ClientRepository):
         except KeyError:
             raise ClientNotFound(f"Client {client_id} doesn't exist.")
 
+    async def get_many(self, client_ids: Sequence[str]) -> list[Client]:
+        return [await self.get(client_id) for client_id in client_ids]
+
     async def list(self) -> list[Client]:
         return list(self._clients.values())
 
@@ -101,9 +151,14 @@ class InMemoryClientRepository(ClientRepository):
 
 
 class RedisClientRepository(ClientRepository):
-    key = "clients"
+    key = "{clients}"
     namespace = key + ":"
     pattern = namespace + "*"
+    # Kept outside of the namespace so that it doesn't match the pattern.
+    # Shares the hash tag with the clients, so that the scripts can update both.
+    count_key = key + "_count"
+    scan_count = 1000
+    cache_ttl = 30.0
 
     def __init__(
         self,
@@ -112,62 +167,106 @@ class RedisClientRepository(ClientRepository):
     ) -> None:
         super().__init__(message_bus)
         self._client = client
-        self._lock = asyncio.Lock()
+        self._add_client = client.register_script(ADD_CLIENT)
+        self._delete_client = client.register_script(DELETE_CLIENT)
+        self._cache: TTLCache[str, Client] = TTLCache(self.cache_ttl)
+        self._fetches: dict[str, asyncio.Task[Client]] = {}
 
     def get_key(self, client_id: str) -> str:
         return f"{self.namespace}{client_id}"
 
-    def get_client_id(self, key: str | bytes) -> str:
-        if isinstance(key, bytes):
-            key = key.decode()
-
-        return key.removeprefix(self.namespace)
+    async def try_add(
+        self, client_id: str, nickname: str, guest: bool, version: str
+    ) -> tuple[Client, bool]:
+        client = Client(id=client_id, nickname=nickname, guest=guest, version=version)
+        existing = await self._add_client(
+            keys=[self.get_key(client_id), self.count_key], args=[client.to_json()]
+        )
 
-    async def add(self, client_id: str, nickname: str, guest: bool, version: str) -> Client:
-        async with self._lock:
-            if await self.exists(client_id):
-                raise ClientAlreadyExists(f"Client {client_id=} already exists.")
+        if existing is not None:
+            return Client.from_raw(existing), False
 
-            client = Client(id=client_id, nickname=nickname, guest=guest, version=version)
-            await self._save(client)
-            return client
+        await self.notify(client.id, Action.ADD, payload=client.to_dict())
+        return client, True
 
     async def get(self, client_id: str) -> Client:
-        data = await self._client.get(self.get_key(client_id))
+        if (cached := self._cache.get(client_id)) is not None:
+            return cached
+
+        if (fetch := self._fetches.get(client_id)) is None:
+            fetch = asyncio.create_task(self._fetch(client_id))
+            # The fetch outlives a cancelled caller, retrieve its exception
+            # so that asyncio doesn't report it as never retrieved.
+            fetch.add_done_callback(lambda task: task.cancelled() or task.exception())
+            self._fetches[client_id] = fetch
+
+        return await asyncio.shield(fetch)
+
+    async def get_many(self, client_ids: Sequence[str]) -> list[Client]:
+        clients: dict[str, Client] = {}
+
+        for client_id in client_ids:
+            if (cached := self._cache.get(client_id)) is not None:
+                clients[client_id] = cached
+
+        if missing := [client_id for client_id in client_ids if client_id not in clients]:
+            data = await self._client.mget([self.get_key(client_id) for client_id in missing])
+
+            for client_id, client_data in zip(missing, data):
+                if client_data is None:
+                    raise ClientNotFound(f"Client {client_id} not found.")
+
+                clients[client_id] = Client.from_raw(client_data)
+
+        return [clients[client_id] for client_id in client_ids]
+
+    async def _fetch(self, client_id: str) -> Client:
+        version = self._cache.version
+
+        try:
+            data = await self._client.get(self.get_key(client_id))
+        finally:
+            # A delete during the fetch drops it from the table already.
+            if self._fetches.get(client_id) is asyncio.current_task():
+                del self._fetches[client_id]
 
         if data is None:
             raise ClientNotFound(f"Client {client_id} not found.")
 
-        return Client.from_raw(data)
+        client = Client.from_raw(data)
+        self._cache.set(client_id, client, version)
+        return client
 
     async def list(self) -> list[Client]:
-        keys = await self._client.keys(self.pattern)
-        get_futures = [self.get(self.get_client_id(key)) for key in keys]
-        return await asyncio.gather(*get_futures)
+        keys = await scan_keys(self._client, self.pattern, self.scan_count)
+
+        if not keys:
+            return []
+
+        clients = await self._client.mget(keys)
+        return [Client.from_raw(data) for data in clients if data is not None]
 
     async def delete(self, client_id: str) -> bool:
-        result = bool(await self._client.delete(self.get_key(client_id)))
+        result = bool(await self._delete_client(keys=[self.get_key(client_id), self.count_key]))
+        self._cache.invalidate(client_id)
+        self._fetches.pop(client_id, None)
         await self.notify(client_id, Action.REMOVE)
         return result
 
     async def clear(self) -> int:
-        keys: list[bytes] = await self._client.keys(self.pattern)
+        keys = await scan_keys(self._client, self.pattern, self.scan_count)
+        count = 0
 
         if len(keys):
-            count: int = await self._client.delete(*keys)
-            return count
-        return 0
+            count = await self._client.unlink(*keys)
+
+        await self._client.set(self.count_key, 0)
+        self._cache.clear()
+        self._fetches.clear()
+        return count
 
     async def count(self) -> int:
-        keys = await self._client.keys(self.pattern)
-        return len(keys)
+        return int(await self._client.get(self.count_key) or 0)
 
     async def exists(self, client_id: str) -> bool:
         return bool(await self._client.exists(self.get_key(client_id)))
-
-    async def _save(self, client: Client) -> bool:
-        model = Client(
-            id=client.id, nickname=client.nickname, guest=client.guest, version=client.version
-        )
-        await self.notify(client.id, Action.ADD, payload=model.to_dict())
-        return bool(await self._client.set(self.get_key(client.id), model.to_json()))
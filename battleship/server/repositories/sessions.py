@@ -2,9 +2,11 @@ import abc
 from typing import Any
 
 import redis.asyncio as redis
+from pydantic import TypeAdapter
 
 from battleship.server.bus import MessageBus
 from battleship.server.repositories.observable import Observable
+from battleship.server.repositories.utils import TTLCache
 from battleship.shared.models import (
     Action,
     Session,
@@ -13,6 +15,8 @@ from battleship.shared.models import (
     make_session_id,
 )
 
+SessionList = TypeAdapter(list[Session])
+
 
 class SessionNotFound(Exception):
     pass
@@ -33,7 +37,7 @@ class SessionRepository(Observable, abc.ABC):
         pass
 
     @abc.abstractmethod
-    async def list(self) -> list[Session]:
+    async def list(self, started: bool | None = None) -> list[Session]:
         pass
 
     @abc.abstractmethod
@@ -44,61 +48,100 @@ class SessionRepository(Observable, abc.ABC):
     async def update(self, session_id: str, **kwargs: Any) -> Session:
         pass
 
+    async def count_started(self) -> int:
+        return len(await self.list(started=True))
+
     async def get_for_client(self, client_id: str) -> Session | None:
-        try:
-            [session] = [s for s in await self.list() if client_id in (s.host_id, s.guest_id)]
-            return session
-        except ValueError:
-            return None
+        sessions = await self.list()
+        return next(
+            (s for s in sessions if s.host_id == client_id or s.guest_id == client_id), None
+        )
+
+    @staticmethod
+    def _get_members(session: Session) -> tuple[str, ...]:
+        return tuple(client_id for client_id in (session.host_id, session.guest_id) if client_id)
 
 
 class InMemorySessionRepository(SessionRepository):
     def __init__(self, message_bus: MessageBus) -> None:
         super().__init__(message_bus)
         self._sessions: dict[SessionID, Session] = {}
+        self._by_client: dict[str, SessionID] = {}
+        self._started_count = 0
 
     async def add(self, host_id: str, data: SessionCreate) -> Session:
         session = Session(id=make_session_id(), host_id=host_id, **data.to_dict())
         self._sessions[session.id] = session
+        self._by_client[host_id] = session.id
         await self.notify(session.id, Action.ADD, payload=session.to_dict())
         return session
 
     async def get(self, session_id: str) -> Session:
         return self._sessions[session_id]
 
-    async def list(self) -> list[Session]:
-        return list(self._sessions.values())
+    async def list(self, started: bool | None = None) -> list[Session]:
+        if started is None:
+            return list(self._sessions.values())
+
+        return [s for s in self._sessions.values() if s.started is started]
+
+    async def count_started(self) -> int:
+        return self._started_count
+
+    async def get_for_client(self, client_id: str) -> Session | None:
+        session_id = self._by_client.get(client_id)
+
+        if session_id is None:
+            return None
+
+        return self._sessions.get(session_id)
 
     async def delete(self, session_id: str) -> bool:
         session = self._sessions.pop(session_id, None)
+
+        if session is not None:
+            if session.started:
+                self._started_count -= 1
+
+            for client_id in self._get_members(session):
+                self._by_client.pop(client_id, None)
+
         await self.notify(session_id, Action.REMOVE)
         return session is not None
 
     async def update(self, session_id: str, **kwargs: Any) -> Session:
         session = await self.get(session_id)
-        updated_session = Session.from_dict({**session.to_dict(), **kwargs})
+        updated_session = session.model_copy(update=kwargs)
+        self._sessions[session_id] = updated_session
+
+        if updated_session.started != session.started:
+            self._started_count += 1 if updated_session.started else -1
+
+        for client_id in self._get_members(updated_session):
+            self._by_client[client_id] = session_id
+
         await self.notify(session_id, Action.START)
         return updated_session
 
 
 class RedisSessionRepository(SessionRepository):
-    key = "sessions"
+    # The hash tag pins the sessions and their index to one cluster slot,
+    # so that they can be written in a single MULTI.
+    key = "{sessions}"
     namespace = key + ":"
-    pattern = namespace + "*"
+    ids_key = key + "_ids"
+    started_key = key + "_started"
+    index_key = key + "_by_client"
+    list_ttl = 2.0
 
     def __init__(self, client: redis.Redis, message_bus: MessageBus) -> None:
         super().__init__(message_bus)
         self._client = client
+        self._list_cache: TTLCache[str, list[Session]] = TTLCache(self.list_ttl)
 
     def get_key(self, session_id: str) -> str:
         return f"{self.namespace}{session_id}"
 
-    def get_session_id(self, key: str | bytes) -> str:
-        if isinstance(key, bytes):
-            key = key.decode()
-
-        return key.removeprefix(self.namespace)
-
     async def add(self, host_id: str, data: SessionCreate) -> Session:
         session = Session(id=make_session_id(), host_id=host_id, **data.to_dict())
         await self._save(session)
@@ -113,22 +156,79 @@ class RedisSessionRepository(SessionRepository):
 
         return Session.from_raw(data)
 
-    async def list(self) -> list[Session]:
-        session_keys = await self._client.keys(pattern=self.pattern)
-        sessions = await self._client.mget(session_keys)
-        return list(map(Session.from_raw, sessions))
+    async def _list_all(self) -> list[Session]:
+        if (cached := self._list_cache.get(self.ids_key)) is not None:
+            return cached
+
+        version = self._list_cache.version
+        session_ids = await self._client.smembers(self.ids_key)  # type: ignore[misc]
+        sessions = []
+
+        if session_ids:
+            data = await self._client.mget([self.get_key(s.decode()) for s in session_ids])
+            raw = [session for session in data if session is not None]
+            sessions = SessionList.validate_json(b"[" + b",".join(raw) + b"]")
+
+        self._list_cache.set(self.ids_key, sessions, version)
+        return sessions
+
+    async def list(self, started: bool | None = None) -> list[Session]:
+        sessions = await self._list_all()
+
+        if started is None:
+            return sessions.copy()
+
+        return [s for s in sessions if s.started is started]
+
+    async def count_started(self) -> int:
+        return int(await self._client.scard(self.started_key))  # type: ignore[misc]
+
+    async def get_for_client(self, client_id: str) -> Session | None:
+        session_id = await self._client.hget(self.index_key, client_id)  # type: ignore[misc]
+
+        if session_id is None:
+            return None
+
+        try:
+            return await self.get(session_id.decode())
+        except SessionNotFound:
+            return None
 
     async def delete(self, session_id: str) -> bool:
-        deleted = await self._client.delete(self.get_key(session_id))
+        try:
+            session = await self.get(session_id)
+        except SessionNotFound:
+            deleted = False
+        else:
+            async with self._client.pipeline(transaction=True) as pipe:
+                pipe.delete(self.get_key(session_id))
+                pipe.hdel(self.index_key, *self._get_members(session))
+                pipe.srem(self.ids_key, session_id)
+                pipe.srem(self.started_key, session_id)
+                [deleted, *_] = await pipe.execute()
+
+        self._list_cache.invalidate(self.ids_key)
         await self.notify(session_id, Action.REMOVE)
         return bool(deleted)
 
     async def update(self, session_id: str, **kwargs: Any) -> Session:
         session = await self.get(session_id)
-        updated_session = Session.from_dict({**session.to_dict(), **kwargs})
+        updated_session = session.model_copy(update=kwargs)
         await self._save(updated_session)
         await self.notify(session_id, Action.START)
         return updated_session
 
     async def _save(self, session: Session) -> None:
-        await self._client.set(self.get_key(session.id), session.to_json())
+        index: dict[str, str] = dict.fromkeys(self._get_members(session), session.id)
+
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.set(self.get_key(session.id), session.to_json())
+            pipe.hset(self.index_key, mapping=index)
+            pipe.sadd(self.ids_key, session.id)
+
+            if session.started:
+                pipe.sadd(self.started_key, session.id)
+
+            await pipe.execute()
+
+        self._list_cache.invalidate(self.ids_key)
@@ -1,10 +1,9 @@
 import abc
-import asyncio
-import random
 
 import redis.asyncio as redis
 from loguru import logger
 
+from battleship.server.repositories.utils import SET_IF_MISSING
 from battleship.shared.models import GameSummary, PlayerStatistics
 
 
@@ -21,6 +20,10 @@ class StatisticsRepository(abc.ABC):
     async def get(self, user_id: str) -> PlayerStatistics:
         pass
 
+    @abc.abstractmethod
+    async def get_or_create(self, user_id: str) -> PlayerStatistics:
+        pass
+
     @abc.abstractmethod
     async def save(self, user_id: str, game_summary: GameSummary) -> bool:
         pass
@@ -31,6 +34,7 @@ class RedisStatisticsRepository(StatisticsRepository):
 
     def __init__(self, client: redis.Redis) -> None:
         self._client = client
+        self._set_if_missing = client.register_script(SET_IF_MISSING)
 
     def get_key(self, user_id: str) -> str:
         return f"{self.key}:{user_id}"
@@ -48,6 +52,15 @@ class RedisStatisticsRepository(StatisticsRepository):
 
         return PlayerStatistics.from_raw(data)
 
+    async def get_or_create(self, user_id: str) -> PlayerStatistics:
+        statistics = PlayerStatistics(user_id=user_id)
+        data = await self._set_if_missing(keys=[self.get_key(user_id)], args=[statistics.to_json()])
+
+        if data is not None:
+            statistics = PlayerStatistics.from_raw(data)
+
+        return statistics
+
     async def save(self, user_id: str, game_summary: GameSummary) -> bool:
         retries = 5
         ok = False
@@ -55,10 +68,7 @@ class RedisStatisticsRepository(StatisticsRepository):
         async with self._client.pipeline(transaction=True) as pipe:
             while not ok and retries:
                 ok = await self._save(user_id, game_summary, pipe)
-
-                if not ok:
-                    retries -= 1
-                    await asyncio.sleep(random.random())
+                retries -= 1
 
         return ok
 
@@ -68,10 +78,9 @@ class RedisStatisticsRepository(StatisticsRepository):
     ) -> bool:
         key = self.get_key(user_id)
 
+        # Commands run immediately after WATCH, until MULTI starts buffering them.
         await pipe.watch(key)
-        await pipe.execute()
-
-        data = await self._client.get(key)
+        data = await pipe.get(key)
 
         if data is None:
             statistics = PlayerStatistics(user_id=user_id)
@@ -80,6 +89,12 @@ class RedisStatisticsRepository(StatisticsRepository):
 
         statistics.update_from_summary(game_summary)
 
-        await pipe.set(key, statistics.to_json())
-        [ok] = await pipe.execute()
+        pipe.multi()  # type: ignore[no-untyped-call]
+        pipe.set(key, statistics.to_json())
+
+        try:
+            [ok] = await pipe.execute()
+        except redis.WatchError:
+            return False
+
         return bool(ok)
@@ -3,6 +3,7 @@ from collections import defaultdict
 
 import redis.asyncio as redis
 
+from battleship.server.repositories.utils import scan_keys
 from battleship.shared.events import Subscription
 
 
@@ -52,9 +53,10 @@ class InMemorySubscriptionRepository(SubscriptionRepository):
 
 
 class RedisSubscriptionsRepository(SubscriptionRepository):
-    key = "subscriptions"
+    key = "{subscriptions}"
     namespace = key + ":"
     pattern = namespace + "*"
+    scan_count = 1000
 
     def __init__(self, client: redis.Redis) -> None:
         self._client = client
@@ -63,8 +65,11 @@ class RedisSubscriptionsRepository(SubscriptionRepository):
         return f"{self.key}:{subscription}"
 
     async def get_subscribers(self, subscription: Subscription) -> set[str]:
-        subscribers = await self._client.smembers(self.get_key(subscription))  # type: ignore[misc]
-        return {subscriber.decode() for subscriber in subscribers}
+        key = self.get_key(subscription)
+        return {
+            subscriber.decode()
+            async for subscriber in self._client.sscan_iter(key, count=self.scan_count)
+        }
 
     async def add_subscriber(self, subscription: Subscription, subscriber: str) -> None:
         await self._client.sadd(self.get_key(subscription), subscriber)  # type: ignore[misc]
@@ -73,7 +78,7 @@ class RedisSubscriptionsRepository(SubscriptionRepository):
         await self._client.srem(self.get_key(subscription), subscriber)  # type: ignore[misc]
 
     async def clear(self) -> None:
-        keys: list[bytes] = await self._client.keys(self.pattern)
+        keys = await scan_keys(self._client, self.pattern, self.scan_count)
 
         if len(keys):
-            await self._client.delete(*keys)
+            await self._client.unlink(*keys)
@@ -0,0 +1,86 @@
+from collections.abc import Hashable
+from time import monotonic
+from typing import Generic, TypeVar
+
+import redis.asyncio as redis
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# Sets KEYS[1] to ARGV[1] unless it exists, returns the existing value if it does.
+# Does what SET NX GET does, but doesn't require Redis 7.0.
+SET_IF_MISSING = """
+local existing = redis.call("GET", KEYS[1])
+
+if existing then
+    return existing
+end
+
+redis.call("SET", KEYS[1], ARGV[1])
+return false
+"""
+
+
+async def scan_keys(client: redis.Redis, pattern: str, count: int = 1000) -> list[bytes]:
+    return [key async for key in client.scan_iter(match=pattern, count=count)]
+
+
+class TTLCache(Generic[K, V]):
+    """
+    In-memory cache with entries expiring after a fixed TTL.
+
+    Holds at most `maxsize` entries. Setting a value drops the expired
+    entries and, when the cache is full, the oldest one.
+
+    Every invalidation bumps the version. Read the version before fetching
+    a value and pass it to `set`, so that a value fetched concurrently
+    with a write isn't cached.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.version = 0
+        self._entries: dict[K, tuple[float, V]] = {}
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+
+        if monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+
+        return value
+
+    def set(self, key: K, value: V, version: int) -> None:
+        if version != self.version:
+            return
+
+        now = monotonic()
+        # Entries share the TTL and are re-inserted on update,
+        # so the insertion order is also the expiration order.
+        self._entries.pop(key, None)
+
+        for oldest, (expires_at, _) in list(self._entries.items()):
+            if expires_at > now and len(self._entries) < self.maxsize:
+                break
+
+            del self._entries[oldest]
+
+        self._entries[key] = (now + self.ttl, value)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def invalidate(self, key: K) -> None:
+        self.version += 1
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self.version += 1
+        self._entries.clear()
@@ -3,6 +3,7 @@ from blacksheep import (
     Request,
     Response,
     Router,
+    TextContent,
     WebSocket,
     bad_request,
     created,
@@ -15,7 +16,6 @@ from blacksheep.server.authorization import allow_anonymous
 from guardpost.authentication import Identity
 from loguru import logger
 
-from battleship.engine import rosters
 from battleship.server import context, metrics, services
 from battleship.server.auth import AuthManager, InvalidSignup, WrongCredentials
 from battleship.server.bus import MessageBus
@@ -38,9 +38,12 @@ from battleship.shared.models import (
     Session,
     SessionCreate,
     SignupCredentials,
+    get_roster_model,
 )
 
 router = Router()
+# Responses get mutated by middlewares, so only the body is shared.
+HEALTH_CONTENT = TextContent("OK")
 
 
 @router.ws("/ws")
@@ -48,32 +51,33 @@ async def ws(
     websocket: WebSocket,
     identity: Identity,
     client_repository: ClientRepository,
-    subscription_repository: SubscriptionRepository,
     message_bus: MessageBus,
 ) -> None:
     user_id = identity.claims["sub"]
     nickname = identity.claims["nickname"]
     guest = identity.has_claim_value("battleship/role", "guest")
     client = await client_repository.add(user_id, nickname, guest, context.client_version.get())
-    connection = Connection(user_id, nickname, websocket, message_bus, subscription_repository)
+    connection = Connection(user_id, nickname, websocket, message_bus)
 
     await websocket.accept()
-    logger.debug(f"{connection} accepted.")
+    logger.debug("{conn} accepted.", conn=connection)
     metrics.websocket_connections.inc({})
 
-    with connection:
-        await connection.listen()
-
-    metrics.websocket_connections.dec({})
-    logger.debug(f"{connection} disconnected.")
-
-    await message_bus.emit("websocket", Message(event=ClientDisconnectedEvent(client_id=client.id)))
+    try:
+        with connection:
+            await connection.listen()
+    finally:
+        metrics.websocket_connections.dec({})
+        logger.debug("{conn} disconnected.", conn=connection)
+
+        await message_bus.emit(
+            "websocket", Message(event=ClientDisconnectedEvent(client_id=client.id))
+        )
 
 
 @router.get("/sessions")
 async def list_sessions(session_repository: SessionRepository) -> list[Session]:
-    sessions = await session_repository.list()
-    return [s for s in sessions if not s.started]
+    return await session_repository.list(started=False)
 
 
 @router.post("/sessions")
@@ -89,21 +93,19 @@ async def create_session(
 @router.post("/sessions/subscribe")
 async def subscribe_to_session_updates(
     identity: Identity,
-    client_repository: ClientRepository,
     subscription_repository: SubscriptionRepository,
 ) -> None:
-    client = await client_repository.get(identity.claims["sub"])
-    await subscription_repository.add_subscriber(Subscription.SESSIONS_UPDATE, client.id)
+    user_id = identity.claims["sub"]
+    await subscription_repository.add_subscriber(Subscription.SESSIONS_UPDATE, user_id)
 
 
 @router.post("/sessions/unsubscribe")
 async def unsubscribe_from_session_updates(
     identity: Identity,
-    client_repository: ClientRepository,
     subscription_repository: SubscriptionRepository,
 ) -> None:
-    client = await client_repository.get(identity.claims["sub"])
-    await subscription_repository.delete_subscriber(Subscription.SESSIONS_UPDATE, client.id)
+    user_id = identity.claims["sub"]
+    await subscription_repository.delete_subscriber(Subscription.SESSIONS_UPDATE, user_id)
 
 
 @router.delete("/sessions/{session_id}")
@@ -141,31 +143,27 @@ async def get_players_online(
 @router.post("/players/subscribe")
 async def subscribe_to_player_count_updates(
     identity: Identity,
-    client_repository: ClientRepository,
     subscription_repository: SubscriptionRepository,
 ) -> None:
-    client = await client_repository.get(identity.claims["sub"])
-    await subscription_repository.add_subscriber(Subscription.PLAYERS_UPDATE, client.id)
+    user_id = identity.claims["sub"]
+    await subscription_repository.add_subscriber(Subscription.PLAYERS_UPDATE, user_id)
 
 
 @router.post("/players/unsubscribe")
 async def unsubscribe_from_player_count_updates(
     identity: Identity,
-    client_repository: ClientRepository,
     subscription_repository: SubscriptionRepository,
 ) -> None:
-    client = await client_repository.get(identity.claims["sub"])
-    await subscription_repository.delete_subscriber(Subscription.PLAYERS_UPDATE, client.id)
+    user_id = identity.claims["sub"]
+    await subscription_repository.delete_subscriber(Subscription.PLAYERS_UPDATE, user_id)
 
 
 @router.get("/rosters/{name}")
 async def get_roster(name: str) -> Roster | Response:
     try:
-        roster_ = rosters.get_roster(name)
+        return get_roster_model(name)
     except KeyError:
         return not_found()
-    else:
-        return Roster.from_domain(roster_)
 
 
 @allow_anonymous()
@@ -206,7 +204,7 @@ async def refresh_id_token(refresh_token: RefreshToken, auth_manager: AuthManage
 @allow_anonymous()
 @router.get("/healthz")
 async def health() -> Response:
-    return ok("OK")
+    return Response(200, content=HEALTH_CONTENT)
 
 
 @router.get("/statistics/{player}")
@@ -46,11 +46,18 @@ class Timeout:
             raise TimeoutError
 
 
-def async_timeout(delay: float | None) -> Timeout:
-    loop = asyncio.get_running_loop()
-
-    if delay is not None:
-        deadline = loop.time() + delay
-    else:
-        deadline = None
-    return Timeout(deadline, loop)
+if sys.version_info >= (3, 11):
+
+    def async_timeout(delay: float | None) -> _Timeout:
+        return asyncio.timeout(delay)
+
+else:
+
+    def async_timeout(delay: float | None) -> Timeout:
+        loop = asyncio.get_running_loop()
+
+        if delay is not None:
+            deadline = loop.time() + delay
+        else:
+            deadline = None
+        return Timeout(deadline, loop)
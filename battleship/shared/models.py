@@ -1,6 +1,7 @@
 import random
 import string
 from enum import auto
+from functools import cache
 from typing import Any, TypeAlias, TypeVar
 
 from pydantic import BaseModel as _BaseModel
@@ -259,6 +260,11 @@ class Roster(BaseModel):
         return cls(name=obj.name, items=items)
 
 
+@cache
+def get_roster_model(name: str) -> Roster:
+    return Roster.from_domain(rosters.get_roster(name))
+
+
 def make_session_id(length: int = 6) -> SessionID:
     alphabet = string.ascii_uppercase + string.digits
     id_ = "".join(random.choices(alphabet, k=length))
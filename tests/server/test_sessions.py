@@ -0,0 +1,66 @@
+import pytest
+
+pytest.importorskip("redis", reason="server dependencies are not installed")
+
+from battleship.server.bus import InMemoryMessageBus  # noqa: E402
+from battleship.server.repositories.sessions import (  # noqa: E402
+    InMemorySessionRepository,
+)
+from battleship.shared.models import SessionCreate  # noqa: E402
+
+
+@pytest.fixture
+def session_repository() -> InMemorySessionRepository:
+    return InMemorySessionRepository(InMemoryMessageBus())
+
+
+@pytest.fixture
+def session_data() -> SessionCreate:
+    return SessionCreate(
+        name="test",
+        roster="classic",
+        firing_order="alternately",
+        salvo_mode=False,
+        no_adjacent_ships=False,
+    )
+
+
+async def test_update_persists_session(session_repository, session_data):
+    session = await session_repository.add("host", session_data)
+
+    await session_repository.update(session.id, guest_id="guest", started=True)
+    stored = await session_repository.get(session.id)
+
+    assert stored.started
+    assert stored.guest_id == "guest"
+
+
+async def test_get_for_client_finds_host_and_guest(session_repository, session_data):
+    session = await session_repository.add("host", session_data)
+
+    assert await session_repository.get_for_client("guest") is None
+
+    await session_repository.update(session.id, guest_id="guest", started=True)
+    host_session = await session_repository.get_for_client("host")
+    guest_session = await session_repository.get_for_client("guest")
+
+    assert host_session is not None and host_session.id == session.id
+    assert guest_session is not None and guest_session.id == session.id
+
+
+async def test_count_started_is_consistent_after_delete(session_repository, session_data):
+    started = await session_repository.add("host", session_data)
+    waiting = await session_repository.add("another_host", session_data)
+    await session_repository.update(started.id, guest_id="guest", started=True)
+
+    assert await session_repository.count_started() == 1
+
+    await session_repository.delete(waiting.id)
+
+    assert await session_repository.count_started() == 1
+
+    await session_repository.delete(started.id)
+
+    assert await session_repository.count_started() == 0
+    assert await session_repository.get_for_client("guest") is None
+    assert await session_repository.get_for_client("host") is None
@@ -0,0 +1,101 @@
+import pytest
+
+pytest.importorskip("redis", reason="server dependencies are not installed")
+
+from battleship.server.repositories import utils  # noqa: E402
+from battleship.server.repositories.utils import TTLCache  # noqa: E402
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(utils, "monotonic", clock)
+    return clock
+
+
+def test_ttl_cache_returns_set_value(clock):
+    cache: TTLCache[str, int] = TTLCache(ttl=10)
+
+    cache.set("key", 1, cache.version)
+
+    assert cache.get("key") == 1
+    assert cache.get("missing") is None
+
+
+def test_ttl_cache_expires_entries(clock):
+    cache: TTLCache[str, int] = TTLCache(ttl=10)
+    cache.set("key", 1, cache.version)
+
+    clock.now = 9.9
+    assert cache.get("key") == 1
+
+    clock.now = 10
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_ignores_value_fetched_during_invalidation(clock):
+    cache: TTLCache[str, int] = TTLCache(ttl=10)
+    version = cache.version
+
+    # A write invalidates the key while the value is being fetched.
+    cache.invalidate("key")
+    cache.set("key", 1, version)
+
+    assert cache.get("key") is None
+
+    cache.set("key", 2, cache.version)
+
+    assert cache.get("key") == 2
+
+
+def test_ttl_cache_invalidate_and_clear(clock):
+    cache: TTLCache[str, int] = TTLCache(ttl=10)
+    cache.set("a", 1, cache.version)
+    cache.set("b", 2, cache.version)
+
+    cache.invalidate("a")
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    version = cache.version
+    cache.clear()
+
+    assert cache.get("b") is None
+    assert cache.version == version + 1
+
+
+def test_ttl_cache_drops_expired_entries_on_set(clock):
+    cache: TTLCache[str, int] = TTLCache(ttl=10)
+    cache.set("a", 1, cache.version)
+    cache.set("b", 2, cache.version)
+
+    clock.now = 10
+    cache.set("c", 3, cache.version)
+
+    assert len(cache) == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_evicts_oldest_entry_when_full(clock):
+    cache: TTLCache[str, int] = TTLCache(ttl=10, maxsize=2)
+    cache.set("a", 1, cache.version)
+    cache.set("b", 2, cache.version)
+    # Updating an entry makes it the newest one.
+    cache.set("a", 3, cache.version)
+
+    cache.set("c", 4, cache.version)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 3
+    assert cache.get("c") == 4